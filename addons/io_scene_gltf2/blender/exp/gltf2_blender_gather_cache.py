@@ -14,6 +14,8 @@
 
 import functools
 
+_MISSING = object()  # sentinel for cache misses, as None is a valid cached result
+
 def cached_by_key(key):
     """
     Decorates functions whose result should be cached. Use it like:
@@ -36,16 +38,18 @@ def cached_by_key(key):
             cache_key = key(*args, **kwargs)
 
             # invalidate cache if export settings have changed
-            if not hasattr(func, "__export_settings") or export_settings != func.__export_settings:
+            # (identity is checked first, as comparing the whole dict is slow)
+            if not hasattr(func, "__export_settings") or \
+                    (export_settings is not func.__export_settings and export_settings != func.__export_settings):
                 func.__cache = {}
                 func.__export_settings = export_settings
             # use or fill cache
-            if cache_key in func.__cache:
-                return func.__cache[cache_key]
-            else:
+            cache = func.__cache
+            result = cache.get(cache_key, _MISSING)
+            if result is _MISSING:
                 result = func(*args, **kwargs)
-                func.__cache[cache_key] = result
-                return result
+                cache[cache_key] = result
+            return result
 
         return wrapper_cached
 
@@ -58,6 +62,10 @@ def default_key(*args, **kwargs):
     Cache on all arguments (except export_settings).
     """
     assert len(args) >= 2 and 0 <= len(kwargs) <= 1, "Wrong signature for cached function"
+    if not kwargs:
+        # Most common case: export_settings is the last positional argument
+        return args[:-1]
+
     cache_key_args = args
     # make a shallow copy of the keyword arguments so that 'export_settings' can be removed
     cache_key_kwargs = dict(kwargs)
@@ -66,13 +74,7 @@ def default_key(*args, **kwargs):
     else:
         cache_key_args = args[:-1]
 
-    cache_key = ()
-    for i in cache_key_args:
-        cache_key += (i,)
-    for i in cache_key_kwargs.values():
-        cache_key += (i,)
-
-    return cache_key
+    return tuple(cache_key_args) + tuple(cache_key_kwargs.values())
 
 
 def cached(func):
@@ -19,19 +19,23 @@ from ...io.exp.gltf2_io_user_extensions import export_user_extensions
 from ..com.gltf2_blender_extras import generate_extras
 from .gltf2_blender_gather_cache import cached
 
+SUPPORTED_CAMERA_TYPES = frozenset({'PERSP', 'ORTHO'})
+
 
 @cached
 def gather_camera(blender_camera, export_settings):
     if not __filter_camera(blender_camera, export_settings):
         return None
 
+    camera_type = __gather_type(blender_camera, export_settings)
+
     camera = gltf2_io.Camera(
         extensions=__gather_extensions(blender_camera, export_settings),
         extras=__gather_extras(blender_camera, export_settings),
         name=__gather_name(blender_camera, export_settings),
-        orthographic=__gather_orthographic(blender_camera, export_settings),
-        perspective=__gather_perspective(blender_camera, export_settings),
-        type=__gather_type(blender_camera, export_settings)
+        orthographic=__gather_orthographic(blender_camera, camera_type, export_settings),
+        perspective=__gather_perspective(blender_camera, camera_type, export_settings),
+        type=camera_type
     )
 
     export_user_extensions('gather_camera_hook', export_settings, camera, blender_camera)
@@ -40,7 +44,7 @@ def gather_camera(blender_camera, export_settings):
 
 
 def __filter_camera(blender_camera, export_settings):
-    return bool(__gather_type(blender_camera, export_settings))
+    return blender_camera.type in SUPPORTED_CAMERA_TYPES
 
 
 def __gather_extensions(blender_camera, export_settings):
@@ -57,8 +61,8 @@ def __gather_name(blender_camera, export_settings):
     return blender_camera.name
 
 
-def __gather_orthographic(blender_camera, export_settings):
-    if __gather_type(blender_camera, export_settings) == "orthographic":
+def __gather_orthographic(blender_camera, camera_type, export_settings):
+    if camera_type == "orthographic":
         orthographic = gltf2_io.CameraOrthographic(
             extensions=None,
             extras=None,
@@ -68,11 +72,8 @@ def __gather_orthographic(blender_camera, export_settings):
             znear=None
         )
 
-        _render = bpy.context.scene.render
-        scene_x = _render.resolution_x * _render.pixel_aspect_x
-        scene_y = _render.resolution_y * _render.pixel_aspect_y
+        scene_x, scene_y = __get_render_dimensions()
         scene_square = max(scene_x, scene_y)
-        del _render
 
         # `Camera().ortho_scale` (and also FOV FTR) maps to the maximum of either image width or image height— This is the box that gets shown from camera view with the checkbox `.show_sensor = True`.
 
@@ -86,8 +87,8 @@ def __gather_orthographic(blender_camera, export_settings):
     return None
 
 
-def __gather_perspective(blender_camera, export_settings):
-    if __gather_type(blender_camera, export_settings) == "perspective":
+def __gather_perspective(blender_camera, camera_type, export_settings):
+    if camera_type == "perspective":
         perspective = gltf2_io.CameraPerspective(
             aspect_ratio=None,
             extensions=None,
@@ -97,22 +98,22 @@ def __gather_perspective(blender_camera, export_settings):
             znear=None
         )
 
-        _render = bpy.context.scene.render
-        width = _render.pixel_aspect_x * _render.resolution_x
-        height = _render.pixel_aspect_y * _render.resolution_y
+        width, height = __get_render_dimensions()
         perspective.aspect_ratio = width / height
-        del _render
 
+        # Blender camera angle is along the horizontal axis when the sensor
+        # fits horizontally, glTF yfov is always vertical
+        angle = blender_camera.angle
+        sensor_fit = blender_camera.sensor_fit
         if width >= height:
-            if blender_camera.sensor_fit != 'VERTICAL':
-                perspective.yfov = 2.0 * math.atan(math.tan(blender_camera.angle * 0.5) / perspective.aspect_ratio)
-            else:
-                perspective.yfov = blender_camera.angle
+            horizontal_fit = sensor_fit != 'VERTICAL'
+        else:
+            horizontal_fit = sensor_fit == 'HORIZONTAL'
+
+        if horizontal_fit:
+            perspective.yfov = 2.0 * math.atan(math.tan(angle * 0.5) / perspective.aspect_ratio)
         else:
-            if blender_camera.sensor_fit != 'HORIZONTAL':
-                perspective.yfov = blender_camera.angle
-            else:
-                perspective.yfov = 2.0 * math.atan(math.tan(blender_camera.angle * 0.5) / perspective.aspect_ratio)
+            perspective.yfov = angle
 
         perspective.znear = blender_camera.clip_start
         perspective.zfar = blender_camera.clip_end
@@ -127,3 +128,12 @@ def __gather_type(blender_camera, export_settings):
     elif blender_camera.type == 'ORTHO':
         return "orthographic"
     return None
+
+
+def __get_render_dimensions():
+    # Read from the scene being exported, as each scene has its own render settings
+    _render = bpy.context.scene.render
+    return (
+        _render.resolution_x * _render.pixel_aspect_x,
+        _render.resolution_y * _render.pixel_aspect_y
+    )
@@ -23,6 +23,16 @@ from .gltf2_blender_gather_cache import cached
 from . import gltf2_blender_gather_light_spots
 from .material import gltf2_blender_search_node_tree
 
+LIGHT_TYPES = {
+    "POINT": "point",
+    "SUN": "directional",
+    "SPOT": "spot"
+}
+
+UNSUPPORTED_LIGHT_TYPES = frozenset({"HEMI", "AREA"})
+
+INV_FOUR_PI = 1.0 / (4.0 * math.pi)
+
 
 @cached
 def gather_lights_punctual(blender_lamp, export_settings) -> Optional[Dict[str, Any]]:
@@ -44,7 +54,7 @@ def gather_lights_punctual(blender_lamp, export_settings) -> Optional[Dict[str,
 
 
 def __filter_lights_punctual(blender_lamp, export_settings) -> bool:
-    if blender_lamp.type in ["HEMI", "AREA"]:
+    if blender_lamp.type in UNSUPPORTED_LIGHT_TYPES:
         gltf2_io_debug.print_console("WARNING", "Unsupported light source {}".format(blender_lamp.type))
         return False
 
@@ -52,15 +62,16 @@ def __filter_lights_punctual(blender_lamp, export_settings) -> bool:
 
 
 def __gather_color(blender_lamp, export_settings) -> Optional[List[float]]:
-    emission_node = __get_cycles_emission_node(blender_lamp)
+    emission_node = __get_cycles_emission_node(blender_lamp, export_settings)
     if emission_node is not None:
-        return list(emission_node.inputs["Color"].default_value)[:3]
-
-    return list(blender_lamp.color)
+        color = emission_node.inputs["Color"].default_value
+    else:
+        color = blender_lamp.color
+    return [color[0], color[1], color[2]]
 
 
 def __gather_intensity(blender_lamp, export_settings) -> Optional[float]:
-    emission_node = __get_cycles_emission_node(blender_lamp)
+    emission_node = __get_cycles_emission_node(blender_lamp, export_settings)
     if emission_node is not None:
         if blender_lamp.type != 'SUN':
             # When using cycles, the strength should be influenced by a LightFalloff node
@@ -70,7 +81,7 @@ def __gather_intensity(blender_lamp, export_settings) -> Optional[float]:
             )
             if result:
                 quadratic_falloff_node = result[0].shader_node
-                emission_strength = quadratic_falloff_node.inputs["Strength"].default_value / (math.pi * 4.0)
+                emission_strength = quadratic_falloff_node.inputs["Strength"].default_value * INV_FOUR_PI
             else:
                 gltf2_io_debug.print_console('WARNING',
                                              'No quadratic light falloff node attached to emission strength property')
@@ -89,7 +100,7 @@ def __gather_intensity(blender_lamp, export_settings) -> Optional[float]:
             # Other than directional, only point and spot lamps are supported by GLTF.
             # In Blender, points are omnidirectional W, and spots are specified as if they're points.
             # Point and spot should both be lm/r^2 in GLTF.
-            emission_luminous = emission_strength / (4*math.pi)
+            emission_luminous = emission_strength * INV_FOUR_PI
         if export_settings['gltf_lighting_mode'] == 'SPEC':
             emission_luminous *= PBR_WATTS_TO_LUMENS
         elif export_settings['gltf_lighting_mode'] == 'COMPAT':
@@ -105,12 +116,8 @@ def __gather_spot(blender_lamp, export_settings) -> Optional[gltf2_io_lights_pun
     return None
 
 
-def __gather_type(blender_lamp, _) -> str:
-    return {
-        "POINT": "point",
-        "SUN": "directional",
-        "SPOT": "spot"
-    }[blender_lamp.type]
+def __gather_type(blender_lamp, _) -> Optional[str]:
+    return LIGHT_TYPES.get(blender_lamp.type)
 
 
 def __gather_range(blender_lamp, export_settings) -> Optional[float]:
@@ -133,7 +140,8 @@ def __gather_extras(blender_lamp, export_settings) -> Optional[Any]:
     return None
 
 
-def __get_cycles_emission_node(blender_lamp) -> Optional[bpy.types.ShaderNodeEmission]:
+@cached
+def __get_cycles_emission_node(blender_lamp, export_settings) -> Optional[bpy.types.ShaderNodeEmission]:
     if blender_lamp.use_nodes and blender_lamp.node_tree:
         for currentNode in blender_lamp.node_tree.nodes:
             is_shadernode_output = isinstance(currentNode, bpy.types.ShaderNodeOutputLight)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import bpy
+import numpy as np
 from .....io.com.gltf2_io_extensions import Extension
 from .....io.com.gltf2_io_constants import GLTF_IOR
 from ....exp import gltf2_blender_get
@@ -97,11 +98,11 @@ def export_specular(blender_material, export_settings):
         return None, None
 
     # TODOExt replace by __has_image_node_from_socket calls
-    specular_not_linked = isinstance(specular_socket, bpy.types.NodeSocket) and not specular_socket.is_linked
-    specular_tint_not_linked = isinstance(specular_tint_socket, bpy.types.NodeSocket) and not specular_tint_socket.is_linked
-    base_color_not_linked = isinstance(base_color_socket, bpy.types.NodeSocket) and not base_color_socket.is_linked
-    transmission_not_linked = isinstance(transmission_socket, bpy.types.NodeSocket) and not transmission_socket.is_linked
-    ior_not_linked = isinstance(ior_socket, bpy.types.NodeSocket) and not ior_socket.is_linked
+    specular_not_linked = specular_socket is not None and not specular_socket.is_linked
+    specular_tint_not_linked = specular_tint_socket is not None and not specular_tint_socket.is_linked
+    base_color_not_linked = base_color_socket is not None and not base_color_socket.is_linked
+    transmission_not_linked = transmission_socket is not None and not transmission_socket.is_linked
+    ior_not_linked = ior_socket is not None and not ior_socket.is_linked
 
     specular = specular_socket.default_value if specular_not_linked else None
     specular_tint = specular_tint_socket.default_value if specular_tint_not_linked else None
@@ -116,24 +117,15 @@ def export_specular(blender_material, export_settings):
 
     if no_texture:
         if specular != BLENDER_SPECULAR or specular_tint != BLENDER_SPECULAR_TINT:
-            import numpy as np
             # See https://gist.github.com/proog128/d627c692a6bbe584d66789a5a6437a33
             specular_ext_enabled = True
 
-            def normalize(c):
-                luminance = lambda c: 0.3 * c[0] + 0.6 * c[1] + 0.1 * c[2]
-                assert(len(c) == 3)
-                l = luminance(c)
-                if l == 0:
-                    return np.array(c)
-                return np.array([c[0] / l, c[1] / l, c[2] / l])
-
             f0_from_ior = ((ior - 1)/(ior + 1))**2
             if f0_from_ior == 0:
                 specular_color = [1.0, 1.0, 1.0]
             else:
-                tint_strength = (1 - specular_tint) + normalize(base_color) * specular_tint
-                specular_color = (1 - transmission) * (1 / f0_from_ior) * 0.08 * specular * tint_strength + transmission * tint_strength
+                tint_strength = (1 - specular_tint) + __normalize_luminance(np.asarray(base_color)) * specular_tint
+                specular_color = ((1 - transmission) * (1 / f0_from_ior) * 0.08 * specular + transmission) * tint_strength
                 specular_color = list(specular_color)
             specular_extension['specularColorFactor'] = specular_color
     else:
@@ -179,3 +171,10 @@ def export_specular(blender_material, export_settings):
 
     specular_extension = Extension('KHR_materials_specular', specular_extension, False) if specular_ext_enabled else None
     return specular_extension, use_actives_uvmaps
+
+def __normalize_luminance(c):
+    assert len(c) == 3
+    l = np.dot((0.3, 0.6, 0.1), c)
+    if l == 0:
+        return c
+    return c / l
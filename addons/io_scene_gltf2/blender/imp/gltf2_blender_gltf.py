@@ -118,6 +118,12 @@ class BlenderGlTF():
         # Init is to False, and will be set to True during creation
         gltf.animation_object = False
 
+        # Rest properties only exist when the animation UI is enabled
+        # Check this once, instead of for each created object
+        object_props = bpy.types.Object.bl_rna.properties
+        gltf.has_animation_rest = 'gltf2_animation_rest' in object_props
+        gltf.has_animation_weight_rest = 'gltf2_animation_weight_rest' in object_props
+
         # Blender material
         if gltf.data.materials:
             for material in gltf.data.materials:
@@ -21,6 +21,11 @@ from .gltf2_blender_camera import BlenderCamera
 from .gltf2_blender_light import BlenderLight
 from .gltf2_blender_vnode import VNode
 
+# Bone-space points used to place edit bones. Frozen, as they are shared.
+BONE_HEAD = Vector((0, 0, 0)).freeze()
+BONE_TAIL = Vector((0, 1, 0)).freeze()
+BONE_ROLL_AXIS = Vector((0, 0, 1)).freeze()
+
 class BlenderNode():
     """Blender Node."""
     def __new__(cls, *args, **kwargs):
@@ -29,34 +34,40 @@ class BlenderNode():
     @staticmethod
     def create_vnode(gltf, vnode_id):
         """Create VNode and all its descendants."""
-        vnode = gltf.vnodes[vnode_id]
-
-        gltf.display_current_node += 1
-        if bpy.app.debug_value == 101:
-            gltf.log.critical("Node %d of %d (id %s)", gltf.display_current_node, len(gltf.vnodes), vnode_id)
-
-        if vnode.type == VNode.Object:
-            gltf_node = gltf.data.nodes[vnode_id] if isinstance(vnode_id, int) else None
-            import_user_extensions('gather_import_node_before_hook', gltf, vnode, gltf_node)
-            obj = BlenderNode.create_object(gltf, vnode_id)
-            import_user_extensions('gather_import_node_after_hook', gltf, vnode, gltf_node, obj)
-            if vnode.is_arma:
-                BlenderNode.create_bones(gltf, vnode_id)
-
-        elif vnode.type == VNode.Bone:
-            # These are created with their armature
-            pass
-
-        elif vnode.type == VNode.DummyRoot:
-            # Don't actually create this
-            vnode.blender_object = None
-
-        for child in vnode.children:
-            BlenderNode.create_vnode(gltf, child)
+        # Depth-first walk, using an explicit stack so deep hierarchies
+        # don't hit the recursion limit
+        vnodes = gltf.vnodes
+        stack = [vnode_id]
+        while stack:
+            vnode_id = stack.pop()
+            vnode = vnodes[vnode_id]
+
+            gltf.display_current_node += 1
+            if bpy.app.debug_value == 101:
+                gltf.log.critical("Node %d of %d (id %s)", gltf.display_current_node, len(vnodes), vnode_id)
+
+            if vnode.type == VNode.Object:
+                gltf_node = gltf.data.nodes[vnode_id] if isinstance(vnode_id, int) else None
+                import_user_extensions('gather_import_node_before_hook', gltf, vnode, gltf_node)
+                obj = BlenderNode.create_object(gltf, vnode_id)
+                import_user_extensions('gather_import_node_after_hook', gltf, vnode, gltf_node, obj)
+                if vnode.is_arma:
+                    BlenderNode.create_bones(gltf, vnode_id)
+
+            elif vnode.type == VNode.Bone:
+                # These are created with their armature
+                pass
+
+            elif vnode.type == VNode.DummyRoot:
+                # Don't actually create this
+                vnode.blender_object = None
+
+            stack.extend(reversed(vnode.children))
 
     @staticmethod
     def create_object(gltf, vnode_id):
-        vnode = gltf.vnodes[vnode_id]
+        vnodes = gltf.vnodes
+        vnode = vnodes[vnode_id]
 
         if vnode.mesh_node_idx is not None:
             obj = BlenderNode.create_mesh_object(gltf, vnode)
@@ -106,11 +117,11 @@ class BlenderNode():
 
         # Set parent
         if vnode.parent is not None:
-            parent_vnode = gltf.vnodes[vnode.parent]
+            parent_vnode = vnodes[vnode.parent]
             if parent_vnode.type == VNode.Object:
                 obj.parent = parent_vnode.blender_object
             elif parent_vnode.type == VNode.Bone:
-                arma_vnode = gltf.vnodes[parent_vnode.bone_arma]
+                arma_vnode = vnodes[parent_vnode.bone_arma]
                 obj.parent = arma_vnode.blender_object
                 obj.parent_type = 'BONE'
                 obj.parent_bone = parent_vnode.blender_bone_name
@@ -121,7 +132,7 @@ class BlenderNode():
 
         # Store Rest matrix of object
         # Can't use directly matrix_world because not refreshed yet
-        if hasattr(obj, 'gltf2_animation_rest'):
+        if gltf.has_animation_rest:
             obj.gltf2_animation_rest = Matrix.LocRotScale(obj.location, obj.rotation_quaternion, obj.scale)
 
         bpy.data.scenes[gltf.blender_scene].collection.objects.link(obj)
@@ -131,70 +142,70 @@ class BlenderNode():
     @staticmethod
     def calc_empty_display_size(gltf, vnode_id):
         # Use min distance to parent/children to guess size
-        sizes = []
-        vids = [vnode_id] + gltf.vnodes[vnode_id].children
-        for vid in vids:
-            vnode = gltf.vnodes[vid]
-            dist = vnode.trs()[0].length
-            sizes.append(dist * 0.4)
+        vnodes = gltf.vnodes
+        vids = [vnode_id] + vnodes[vnode_id].children
+        # Only the final translation is needed. Don't call trs() here: children
+        # are not created yet, and their hooks may still change their TRS.
+        sizes = [(vnodes[vid].rotation_after @ vnodes[vid].base_trs[0]).length * 0.4 for vid in vids]
         return max(min(sizes, default=1), 0.001)
 
     @staticmethod
     def create_bones(gltf, arma_id):
-        arma = gltf.vnodes[arma_id]
+        vnodes = gltf.vnodes
+        arma = vnodes[arma_id]
         blender_arma = arma.blender_object
         armature = blender_arma.data
 
         # Find all bones for this arma
         bone_ids = []
-        def visit(id):  # Depth-first walk
-            if gltf.vnodes[id].type == VNode.Bone:
+        stack = list(reversed(arma.children))
+        while stack:  # Depth-first walk
+            id = stack.pop()
+            if vnodes[id].type == VNode.Bone:
                 bone_ids.append(id)
-                for child in gltf.vnodes[id].children:
-                    visit(child)
-        for child in arma.children:
-            visit(child)
+                stack.extend(reversed(vnodes[id].children))
 
         # Switch into edit mode to create all edit bones
 
         if bpy.context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
-        bpy.context.window.scene = bpy.data.scenes[gltf.blender_scene]
+        if bpy.context.window.scene.name != gltf.blender_scene:
+            bpy.context.window.scene = bpy.data.scenes[gltf.blender_scene]
         bpy.context.view_layer.objects.active = blender_arma
         bpy.ops.object.mode_set(mode="EDIT")
 
+        editbones = {}
         for id in bone_ids:
-            vnode = gltf.vnodes[id]
+            vnode = vnodes[id]
             editbone = armature.edit_bones.new(vnode.name or vnode.default_name)
+            editbones[id] = editbone
             vnode.blender_bone_name = editbone.name
             editbone.use_connect = False  # TODO?
 
             # Give the position of the bone in armature space
             arma_mat = vnode.editbone_arma_mat
-            editbone.head = arma_mat @ Vector((0, 0, 0))
-            editbone.tail = arma_mat @ Vector((0, 1, 0))
+            editbone.head = arma_mat @ BONE_HEAD
+            editbone.tail = arma_mat @ BONE_TAIL
             editbone.length = vnode.bone_length
-            editbone.align_roll(arma_mat @ Vector((0, 0, 1)) - editbone.head)
+            editbone.align_roll(arma_mat @ BONE_ROLL_AXIS - editbone.head)
 
             if isinstance(id, int):
                 pynode = gltf.data.nodes[id]
                 set_extras(editbone, pynode.extras)
 
         # Set all bone parents
-        for id in bone_ids:
-            vnode = gltf.vnodes[id]
-            parent_vnode = gltf.vnodes[vnode.parent]
-            if parent_vnode.type == VNode.Bone:
-                editbone = armature.edit_bones[vnode.blender_bone_name]
-                parent_editbone = armature.edit_bones[parent_vnode.blender_bone_name]
-                editbone.parent = parent_editbone
+        for id, editbone in editbones.items():
+            parent_id = vnodes[id].parent
+            if vnodes[parent_id].type == VNode.Bone:
+                editbone.parent = editbones[parent_id]
 
         # Switch back to object mode and do pose bones
         bpy.ops.object.mode_set(mode="OBJECT")
 
+        pose_bones = blender_arma.pose.bones
         for id in bone_ids:
-            vnode = gltf.vnodes[id]
-            pose_bone = blender_arma.pose.bones[vnode.blender_bone_name]
+            vnode = vnodes[id]
+            pose_bone = pose_bones[vnode.blender_bone_name]
 
             # BoneTRS = EditBone * PoseBone
             # Set PoseBone to make BoneTRS = vnode.trs.
@@ -255,16 +266,21 @@ class BlenderNode():
     def set_morph_weights(gltf, pynode, obj):
         pymesh = gltf.data.meshes[pynode.mesh]
         weights = pynode.weights or pymesh.weights or []
+        if obj.data.shape_keys is None:
+            # All shapekeys were skipped on mesh creation
+            return
+        key_blocks = obj.data.shape_keys.key_blocks
+        names = pymesh.shapekey_names
         for i, weight in enumerate(weights):
-            if pymesh.shapekey_names[i] is not None:
-                kb = obj.data.shape_keys.key_blocks[pymesh.shapekey_names[i]]
+            if names[i] is not None:
+                kb = key_blocks[names[i]]
                 # extend range if needed
                 if weight < kb.slider_min: kb.slider_min = weight
                 if weight > kb.slider_max: kb.slider_max = weight
                 kb.value = weight
 
                 # Store default weight
-                if hasattr(obj, 'gltf2_animation_weight_rest'):
+                if gltf.has_animation_weight_rest:
                     w = obj.gltf2_animation_weight_rest.add()
                     w.val = weight
 
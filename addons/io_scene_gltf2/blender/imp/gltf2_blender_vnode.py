@@ -58,6 +58,7 @@ class VNode:
         # Allows per-vnode axis adjustment. See local_rotation.
         self.rotation_after = Quaternion((1, 0, 0, 0))
         self.rotation_before = Quaternion((1, 0, 0, 0))
+        self.final_trs = None  # cache for trs()
 
         # Indices of the glTF node where the mesh, etc. came from.
         # (They can get moved around.)
@@ -67,13 +68,19 @@ class VNode:
 
     def trs(self):
         # (final TRS) = (rotation after) (base TRS) (rotation before)
-        t, r, s = self.base_trs
-        m = scale_rot_swap_matrix(self.rotation_before)
-        return (
-            self.rotation_after @ t,
-            self.rotation_after @ r @ self.rotation_before,
-            m @ s,
-        )
+        # Cached, and never invalidated: base_trs, rotation_before and
+        # rotation_after must not change after the first call. Only call it
+        # when creating the vnode's own object or bone, once its
+        # gather_import_node_before_hook has run.
+        if self.final_trs is None:
+            t, r, s = self.base_trs
+            m = scale_rot_swap_matrix(self.rotation_before)
+            self.final_trs = (
+                self.rotation_after @ t,
+                self.rotation_after @ r @ self.rotation_before,
+                m @ s,
+            )
+        return self.final_trs
 
     def base_locs_to_final_locs(self, base_locs):
         ra = self.rotation_after